@@ -1,6 +1,10 @@
 import json
 import time
 import os
+import sys
+import asyncio
+from array import array
+from bisect import bisect_left
 import requests
 import threading
 from pymongo import MongoClient, errors
@@ -43,6 +47,112 @@ except errors.ServerSelectionTimeoutError as e:
 # ======================
 pairings = {}       # code -> receiver WebSocket
 sender_links = {}   # sender WebSocket -> receiver WebSocket
+parked = {}         # code int -> {"event", "waiters"} for senders waiting on a known receiver
+
+# Codes seen within this window are loaded back on startup
+WARM_START_WINDOW = int(os.getenv("WARM_START_WINDOW", 7 * 24 * 3600))
+# How often last_updated is refreshed for connected receivers
+HEARTBEAT_INTERVAL = int(os.getenv("HEARTBEAT_INTERVAL", 600))
+# How long a sender with a known code waits for its receiver to reconnect
+SENDER_PARK_TIMEOUT = float(os.getenv("SENDER_PARK_TIMEOUT", 20))
+
+def code_key(code):
+    """Pairing codes are 10-digit numbers; return the int form, or None if invalid."""
+    try:
+        key = int(str(code).strip())
+    except (TypeError, ValueError):
+        return None
+    return key if 0 <= key < 10**10 else None
+
+class KnownCodes:
+    """Sorted array of known pairing codes (8 bytes each), looked up by binary search."""
+
+    def __init__(self, codes=()):
+        self.codes = array("Q", sorted(set(codes)))
+
+    def __len__(self):
+        return len(self.codes)
+
+    def __contains__(self, code):
+        key = code_key(code)
+        if key is None:
+            return False
+        i = bisect_left(self.codes, key)
+        return i < len(self.codes) and self.codes[i] == key
+
+    def add(self, code):
+        key = code_key(code)
+        if key is None:
+            return
+        i = bisect_left(self.codes, key)
+        if i == len(self.codes) or self.codes[i] != key:
+            self.codes.insert(i, key)
+
+    def discard(self, code):
+        key = code_key(code)
+        if key is None:
+            return
+        i = bisect_left(self.codes, key)
+        if i < len(self.codes) and self.codes[i] == key:
+            del self.codes[i]
+
+    def nbytes(self):
+        return sys.getsizeof(self.codes)
+
+known_codes = KnownCodes()
+warm_start_stats = {"codes": 0, "seconds": 0.0, "bytes": known_codes.nbytes()}
+
+def warm_start():
+    """Bulk-load recently active codes from Mongo so senders survive a relay restart."""
+    global known_codes
+    if pairings_col is None:
+        return
+    started = time.perf_counter()
+    cutoff = time.time() - WARM_START_WINDOW
+    try:
+        cursor = pairings_col.find(
+            {"$or": [{"active": True}, {"last_updated": {"$gte": cutoff}}],
+             "superseded": {"$ne": True}},
+            {"code": 1, "_id": 0},
+            batch_size=10000,
+        )
+        keys = (code_key(doc.get("code")) for doc in cursor)
+        known_codes = KnownCodes(k for k in keys if k is not None)
+    except Exception as e:
+        print("⚠️ Warm start failed:", e)
+        return
+    warm_start_stats.update(
+        codes=len(known_codes),
+        seconds=round(time.perf_counter() - started, 4),
+        bytes=known_codes.nbytes(),
+    )
+    print(f"♨️ Warm start: {warm_start_stats['codes']} codes in "
+          f"{warm_start_stats['seconds'] * 1000:.1f} ms, {warm_start_stats['bytes']} bytes")
+
+def supersede_code(code):
+    """Forget a code its receiver has replaced, so senders holding it are rejected at once."""
+    known_codes.discard(code)
+    print(f"♻️ Code {code} superseded")
+    if pairings_col is not None:
+        try:
+            pairings_col.update_one({"code": code}, {"$set": {"active": False, "superseded": True}})
+        except Exception as e:
+            print("⚠️ Mongo update failed:", e)
+
+async def wait_for_receiver(code, timeout):
+    """Park a sender until the receiver for `code` registers, or until timeout."""
+    key = code_key(code)
+    slot = parked.setdefault(key, {"event": asyncio.Event(), "waiters": 0})
+    slot["waiters"] += 1
+    try:
+        await asyncio.wait_for(slot["event"].wait(), timeout)
+    except asyncio.TimeoutError:
+        pass
+    finally:
+        slot["waiters"] -= 1
+        if slot["waiters"] == 0 and parked.get(key) is slot:
+            del parked[key]
+    return pairings.get(code)
 
 # ======================
 # FastAPI App
@@ -63,6 +173,9 @@ def status():
         "active_pairings": list(pairings.keys()),
         "senders_count": len(sender_links),
         "receivers_count": len(pairings),
+        "known_codes": len(known_codes),
+        "parked_senders": sum(slot["waiters"] for slot in parked.values()),
+        "warm_start": warm_start_stats,
     }
 
 # ======================
@@ -83,8 +196,20 @@ async def websocket_endpoint(ws: WebSocket):
             if msg.get("role") == "receiver":
                 code = msg["code"]
                 pairings[code] = ws
+                known_codes.add(code)
                 print(f"📌 Receiver registered with code {code}")
 
+                # A receiver that regenerated its code says which one it replaces
+                replaced = msg.get("replaces")
+                # (unless another live receiver is still registered under it)
+                if replaced and replaced != code and pairings.get(replaced) in (None, ws):
+                    pairings.pop(replaced, None)
+                    supersede_code(replaced)
+
+                slot = parked.pop(code_key(code), None)
+                if slot is not None:
+                    slot["event"].set()
+
                 if pairings_col is not None:
                     try:
                         pairings_col.update_one(
@@ -92,6 +217,7 @@ async def websocket_endpoint(ws: WebSocket):
                             {"$set": {
                                 "receiver_addr": addr,
                                 "active": True,
+                                "superseded": False,
                                 "last_updated": time.time()
                             }},
                             upsert=True
@@ -102,8 +228,14 @@ async def websocket_endpoint(ws: WebSocket):
             # Sender connects
             elif msg.get("role") == "sender":
                 code = msg["code"]
-                if code in pairings:
-                    sender_links[ws] = pairings[code]
+                receiver = pairings.get(code)
+                if receiver is None and code in known_codes:
+                    # Known code whose receiver hasn't reconnected yet (e.g. after a relay restart)
+                    print(f"⏸️ Sender parked for code {code}")
+                    await ws.send_json({"status": "waiting", "code": code})
+                    receiver = await wait_for_receiver(code, SENDER_PARK_TIMEOUT)
+                if receiver is not None:
+                    sender_links[ws] = receiver
                     print(f"🔗 Sender linked to receiver {code}")
                     await ws.send_json({"status": "linked", "code": code})
 
@@ -133,6 +265,12 @@ async def websocket_endpoint(ws: WebSocket):
                             await s.send_text(json.dumps(msg))
                     direction = "receiver->sender"
 
+                    # Remote regenerate_code: the receiver's old code is now revoked
+                    if "new_code" in msg:
+                        for old, r in list(pairings.items()):
+                            if r == ws and old != msg["new_code"]:
+                                supersede_code(old)
+
                 if messages_col is not None:
                     try:
                         messages_col.insert_one({
@@ -156,7 +294,10 @@ async def websocket_endpoint(ws: WebSocket):
                     del pairings[code]
                     if pairings_col is not None:
                         try:
-                            pairings_col.update_one({"code": code}, {"$set": {"active": False}})
+                            pairings_col.update_one(
+                                {"code": code},
+                                {"$set": {"active": False, "last_updated": time.time()}}
+                            )
                         except Exception as e:
                             print("⚠️ Mongo update failed:", e)
         print(f"🧹 Cleaned up {addr}")
@@ -174,6 +315,28 @@ def keep_alive():
             print("⚠️ Keep-alive ping failed:", e)
         time.sleep(300)  # 5 min
 
+# ======================
+# Pairing Heartbeat Thread
+# ======================
+def heartbeat():
+    """Refresh last_updated for connected receivers so long-lived ones stay warm."""
+    while True:
+        time.sleep(HEARTBEAT_INTERVAL)
+        if pairings_col is None:
+            continue
+        try:
+            codes = list(pairings)  # may race with the event loop; retried next beat
+            if not codes:
+                continue
+            pairings_col.update_many(
+                {"code": {"$in": codes}},
+                {"$set": {"active": True, "last_updated": time.time()}}
+            )
+        except Exception as e:
+            print("⚠️ Mongo heartbeat failed:", e)
+
 @app.on_event("startup")
 def startup_event():
+    warm_start()
     threading.Thread(target=keep_alive, daemon=True).start()
+    threading.Thread(target=heartbeat, daemon=True).start()
@@ -0,0 +1,275 @@
+import os
+import re
+import shlex
+import struct
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+# ============================
+# BULK APP DISCOVERY
+# ============================
+# Files picked up as launchable apps, wherever they are found
+LAUNCHER_EXTS = {".exe", ".lnk", ".url", ".desktop", ".appimage"}
+# Installers, uninstallers, updaters and redistributables, matched on the file stem
+SKIP_NAME = re.compile(
+    r"^(?:unins.*|setup|setup_?x?(?:86|64)|install|installer|update|updater"
+    r"|vc_?redist.*|dxsetup|dxwebsetup|dotnetfx.*|oalinst|ue4prereqsetup.*"
+    r"|crashreporter|crashreportclient|crashhandler|crashpad_handler|unitycrashhandler(?:32|64)?"
+    r"|launcherpatcher)$",
+    re.IGNORECASE,
+)
+# Folders that never contain anything worth importing
+SKIP_DIRS = {"__pycache__", "node_modules", "_commonredist", "redist", "redistributables",
+             "directx", "$recycle.bin", "windowsapps"}
+
+DEFAULT_MAX_DEPTH = 4
+DEFAULT_WORKERS = 8
+
+def default_scan_roots():
+    """Common install and launcher folders for this platform."""
+    roots = []
+    if os.name == "nt":
+        program_files = os.getenv("ProgramFiles")
+        program_files_x86 = os.getenv("ProgramFiles(x86)")
+        program_data = os.getenv("ProgramData")
+        appdata = os.getenv("APPDATA")
+        if program_data:
+            roots.append(os.path.join(program_data, "Microsoft", "Windows", "Start Menu", "Programs"))
+        if appdata:
+            roots.append(os.path.join(appdata, "Microsoft", "Windows", "Start Menu", "Programs"))
+        if program_files_x86:
+            roots.append(os.path.join(program_files_x86, "Steam", "steamapps", "common"))
+        roots += [p for p in (program_files, program_files_x86) if p]
+    else:
+        home = os.path.expanduser("~")
+        roots += [
+            "/usr/share/applications",
+            os.path.join(home, ".local", "share", "applications"),
+            os.path.join(home, ".local", "share", "Steam", "steamapps", "common"),
+        ]
+    return [r for r in roots if os.path.isdir(r)]
+
+def path_key(path):
+    """Key used to de-duplicate apps: the resolved, case-normalized path."""
+    return os.path.normcase(os.path.realpath(path))
+
+def catalog_keys(paths):
+    """De-duplication keys for paths already stored in the catalog."""
+    keys = set()
+    for p in paths:
+        keys.add(p)
+        keys.add(path_key(p))
+        ext = os.path.splitext(p)[1].lower()
+        target = read_lnk_target(p) if ext == ".lnk" else read_url_target(p) if ext == ".url" else None
+        if target:
+            keys.add(_target_key(target))
+        try:
+            target = shlex.split(p)[0]
+        except (ValueError, IndexError):
+            continue
+        if os.path.isabs(target):
+            keys.add(path_key(target))
+    return keys
+
+def parse_desktop_file(path):
+    """Return (name, command) for a .desktop application launcher, or None."""
+    fields = {}
+    in_entry = False
+    try:
+        with open(path, "r", encoding="utf-8", errors="replace") as f:
+            for line in f:
+                line = line.strip()
+                if line.startswith("["):
+                    in_entry = line == "[Desktop Entry]"
+                elif in_entry and "=" in line:
+                    key, value = line.split("=", 1)
+                    fields.setdefault(key.strip(), value.strip())
+    except OSError:
+        return None
+    if fields.get("Type", "Application") != "Application":
+        return None
+    if fields.get("NoDisplay", "").lower() == "true" or fields.get("Hidden", "").lower() == "true":
+        return None
+    command = fields.get("Exec")
+    if not command:
+        return None
+    # Drop field codes such as %f, %U, %i
+    command = " ".join(tok for tok in command.split() if not (len(tok) == 2 and tok[0] == "%"))
+    name = fields.get("Name") or os.path.splitext(os.path.basename(path))[0]
+    return name, command
+
+def read_lnk_target(path):
+    """Return the local target path of a Windows .lnk shortcut, or None.
+
+    Parses the LinkInfo block of the Shell Link format ([MS-SHLLINK]):
+    LocalBasePath + CommonPathSuffix, preferring the Unicode variants.
+    """
+    try:
+        with open(path, "rb") as f:
+            data = f.read(64 * 1024)
+        if len(data) < 0x4C or struct.unpack_from("<I", data, 0)[0] != 0x4C:
+            return None
+        flags = struct.unpack_from("<I", data, 0x14)[0]
+        pos = 0x4C
+        if flags & 0x01:  # HasLinkTargetIDList
+            pos += 2 + struct.unpack_from("<H", data, pos)[0]
+        if not flags & 0x02:  # HasLinkInfo
+            return None
+        header_size, info_flags, _, base_off, _, suffix_off = struct.unpack_from("<6I", data, pos + 4)
+        if not info_flags & 0x01:  # VolumeIDAndLocalBasePath
+            return None
+
+        def ansi(off):
+            raw = data[pos + off:data.index(b"\0", pos + off)]
+            return raw.decode("mbcs" if os.name == "nt" else "cp1252", errors="replace")
+
+        def wide(off):
+            start = pos + off
+            end = start
+            while end + 1 < len(data) and data[end:end + 2] != b"\0\0":
+                end += 2
+            return data[start:end].decode("utf-16-le", errors="replace")
+
+        if header_size >= 0x24:
+            base_off_u, suffix_off_u = struct.unpack_from("<2I", data, pos + 28)
+            if base_off_u:
+                return wide(base_off_u) + (wide(suffix_off_u) if suffix_off_u else "")
+        return ansi(base_off) + ansi(suffix_off)
+    except (OSError, struct.error, ValueError, IndexError):
+        return None
+
+def read_url_target(path):
+    """Return the URL= entry of an Internet Shortcut (.url) file, or None."""
+    try:
+        with open(path, "r", encoding="utf-8", errors="replace") as f:
+            for line in f:
+                if line.strip().lower().startswith("url="):
+                    return line.strip()[4:]
+    except OSError:
+        pass
+    return None
+
+def _target_key(target):
+    if target.lower().startswith("file:///"):
+        target = target[8:] if os.name == "nt" else target[7:]
+    if os.path.isabs(target):
+        return path_key(target)
+    return target
+
+def _launchable(entry):
+    """Return (name, stored_path, dedupe_key) for a launchable file, else None.
+
+    Shortcuts are stored as themselves (they carry arguments and a working
+    directory) but de-duplicated by the target they point to.
+    """
+    stem, ext = os.path.splitext(entry.name)
+    ext = ext.lower()
+    if SKIP_NAME.match(stem.strip()):
+        return None
+    if ext == ".desktop":
+        parsed = parse_desktop_file(entry.path)
+        if not parsed:
+            return None
+        name, command = parsed
+        try:
+            target = shlex.split(command)[0]
+        except (ValueError, IndexError):
+            target = command
+        key = path_key(target) if os.path.isabs(target) else command
+        return name, command, key
+    if ext == ".lnk":
+        target = read_lnk_target(entry.path)
+        if target and SKIP_NAME.match(os.path.splitext(os.path.basename(target.replace("\\", "/")))[0]):
+            return None
+        return stem, entry.path, _target_key(target) if target else path_key(entry.path)
+    if ext == ".url":
+        target = read_url_target(entry.path)
+        return stem, entry.path, _target_key(target) if target else path_key(entry.path)
+    if ext in LAUNCHER_EXTS:
+        return stem, entry.path, path_key(entry.path)
+    if os.name != "nt" and not ext and os.access(entry.path, os.X_OK):
+        return stem, entry.path, path_key(entry.path)
+    return None
+
+def _scan_dir(path, depth, cache, lock):
+    """List one directory, reusing the cached listing if its mtime is unchanged."""
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except OSError:
+        return [], [], depth
+    with lock:
+        cached = cache.get(path)
+    if cached and cached.get("mtime") == mtime:
+        return cached["apps"], cached["dirs"], depth
+
+    apps, dirs = [], []
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if not entry.name.startswith(".") and entry.name.lower() not in SKIP_DIRS:
+                            dirs.append(entry.path)
+                    elif entry.is_file():
+                        app = _launchable(entry)
+                        if app:
+                            apps.append(list(app))
+                except OSError:
+                    continue
+    except OSError:
+        return [], [], depth
+
+    with lock:
+        cache[path] = {"mtime": mtime, "apps": apps, "dirs": dirs}
+    return apps, dirs, depth
+
+def scan_roots(roots, on_found, cache=None, seen=None, max_depth=DEFAULT_MAX_DEPTH,
+               max_workers=DEFAULT_WORKERS, should_stop=None):
+    """Scan `roots` in parallel and call on_found(name, path) for each new app.
+
+    Directories are listed on a thread pool; subdirectories are queued as
+    their parent finishes, so results stream out while the scan continues.
+    `cache` maps a directory to its last listing and mtime and is updated in
+    place, so a re-scan only re-lists folders that changed. `seen` holds
+    catalog_keys() of the existing catalog and is extended with the dedupe
+    key (resolved path, or shortcut target) of every app reported.
+    on_found is always called from the calling thread. If should_stop()
+    returns True, queued folders are dropped and the scan ends early.
+    Returns the number of apps reported.
+    """
+    cache = {} if cache is None else cache
+    seen = set() if seen is None else seen
+    lock = threading.Lock()
+    count = 0
+    visited = set()
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        pending = set()
+        for root in roots:
+            root = os.path.abspath(os.path.expanduser(root))
+            if os.path.isdir(root) and path_key(root) not in visited:
+                visited.add(path_key(root))
+                pending.add(pool.submit(_scan_dir, root, 0, cache, lock))
+
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            if should_stop and should_stop():
+                for future in pending:
+                    future.cancel()
+                break
+            for future in done:
+                apps, dirs, depth = future.result()
+                for name, stored_path, key in apps:
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                    count += 1
+                    on_found(name, stored_path)
+                if depth >= max_depth:
+                    continue
+                for sub in dirs:
+                    sub_key = path_key(sub)
+                    if sub_key not in visited:
+                        visited.add(sub_key)
+                        pending.add(pool.submit(_scan_dir, sub, depth + 1, cache, lock))
+    return count
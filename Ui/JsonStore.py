@@ -0,0 +1,114 @@
+import atexit
+import copy
+import json
+import os
+import tempfile
+import threading
+import time
+
+# ============================
+# ATOMIC, DEBOUNCED JSON FILES
+# ============================
+_STORES = []
+
+class JsonStore:
+    """One JSON file kept in memory and written back atomically.
+
+    save() only records a snapshot of the new value and arms a timer if none
+    is pending, so callers can keep mutating their object and a burst of
+    edits within `delay` seconds ends up as a single write. Every write goes
+    to a temp file in the same folder which is then renamed over the real
+    file, so a crash leaves either the old or the new file, never a torn one.
+    """
+
+    def __init__(self, path, default, delay=0.5, compact=True):
+        self.path = path
+        self.default = default
+        self.delay = delay
+        self.compact = compact
+        self.data = None
+        self.dirty = False
+        self.timer = None
+        self.lock = threading.RLock()
+        _STORES.append(self)
+
+    def exists(self):
+        return self.data is not None or os.path.exists(self.path)
+
+    def load(self):
+        with self.lock:
+            if self.data is None:
+                try:
+                    with open(self.path, "r", encoding="utf-8") as f:
+                        self.data = json.load(f)
+                except FileNotFoundError:
+                    self.data = copy.deepcopy(self.default)
+                except Exception as e:
+                    print(f"Error loading {os.path.basename(self.path)}:", e)
+                    self.data = copy.deepcopy(self.default)
+            return self.data
+
+    def save(self, data):
+        """Schedule a write of `data`; rapid successive saves are coalesced."""
+        with self.lock:
+            self.data = copy.deepcopy(data)
+            self.dirty = True
+            if self.delay <= 0:
+                self._write_locked()
+                return
+            if self.timer is None:
+                self.timer = threading.Timer(self.delay, self.flush)
+                self.timer.daemon = True
+                self.timer.start()
+
+    def save_now(self, data):
+        with self.lock:
+            self.data = copy.deepcopy(data)
+            self.dirty = True
+            self._write_locked()
+
+    def flush(self):
+        with self.lock:
+            if self.dirty:
+                self._write_locked()
+
+    def _write_locked(self):
+        if self.timer:
+            self.timer.cancel()
+            self.timer = None
+        folder = os.path.dirname(self.path) or "."
+        fd, tmp_path = tempfile.mkstemp(prefix=".tmp-", suffix=".json", dir=folder)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                if self.compact:
+                    json.dump(self.data, f, separators=(",", ":"))
+                else:
+                    json.dump(self.data, f, indent=4)
+                f.flush()
+                os.fsync(f.fileno())
+            _replace(tmp_path, self.path)
+            self.dirty = False
+        except Exception as e:
+            print(f"Error saving {os.path.basename(self.path)}:", e)
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+def _replace(src, dst, attempts=5):
+    # On Windows the target can be briefly locked (e.g. by an antivirus scan)
+    for i in range(attempts):
+        try:
+            os.replace(src, dst)
+            return
+        except PermissionError:
+            if i == attempts - 1:
+                raise
+            time.sleep(0.05 * (i + 1))
+
+def flush_all():
+    """Write out every pending save; registered to run at interpreter exit."""
+    for store in list(_STORES):
+        store.flush()
+
+atexit.register(flush_all)
@@ -0,0 +1,194 @@
+import os
+import re
+import shlex
+import shutil
+import subprocess
+import threading
+import time
+
+# ============================
+# LAUNCH PLANS
+# ============================
+# Characters that only mean something to a shell; their presence keeps shell=True.
+# Environment variables and ~ are expanded here, so they don't force a shell.
+SHELL_CHARS = set("&|<>^") if os.name == "nt" else set("&|<>;`*?")
+# Shell builtins that have no executable to resolve
+SHELL_BUILTINS = (
+    {"start", "cd", "call", "echo", "set", "if", "for", "pushd", "popd", "title",
+     "type", "dir", "copy", "del", "move", "ren", "mkdir", "md", "rd", "cls", "exit"}
+    if os.name == "nt" else
+    {"cd", "source", ".", "export", "exec", "eval", "set", "alias", "exit", "echo"}
+)
+# "scheme:..." URIs such as steam://run/1, ms-settings:display or mailto:x
+# (two or more letters, so Windows drive letters like C:\ don't match)
+URI_SCHEME = re.compile(r"^[A-Za-z][A-Za-z0-9+.-]+:")
+# File types that can be started directly without going through the shell
+DIRECT_EXTS = {".exe", ".com"}
+
+REVALIDATE_INTERVAL = 30  # seconds
+
+def file_stamp(path):
+    try:
+        st = os.stat(path)
+        return [st.st_mtime_ns, st.st_size]
+    except OSError:
+        return None
+
+def _split(raw):
+    tokens = shlex.split(raw, posix=os.name != "nt")
+    if os.name == "nt":
+        tokens = [t[1:-1] if len(t) >= 2 and t[0] == t[-1] == '"' else t for t in tokens]
+    return tokens
+
+def _expand(text):
+    return os.path.expanduser(os.path.expandvars(text))
+
+def _needs_shell(raw):
+    if any(c in SHELL_CHARS for c in raw) or "$(" in raw:
+        return True
+    first = raw.split(None, 1)[0].strip('"')
+    return (first.lower() if os.name == "nt" else first) in SHELL_BUILTINS
+
+def _is_direct(exe):
+    if os.name == "nt":
+        return os.path.splitext(exe)[1].lower() in DIRECT_EXTS
+    return os.path.isfile(exe) and os.access(exe, os.X_OK)
+
+def compile_plan(raw):
+    """Turn a stored catalog path into a launch plan.
+
+    A plan records the resolved executable, its arguments, a working
+    directory, whether a shell is really required, and whether the target
+    exists at all (`ok`/`error`), so launches skip the lookup and broken
+    entries are known before anyone taps them. Only a plain path that does
+    not exist is marked broken; anything that needs a shell and can't be
+    resolved up front falls back to the shell, as before.
+    """
+    raw = raw.strip()
+    plan = {"raw": raw, "exe": None, "argv": None, "cwd": None, "shell": True,
+            "ok": True, "error": None, "stamp": None}
+    if not raw:
+        plan.update(ok=False, error="Empty path")
+        return plan
+
+    plain = _expand(raw.strip('"'))
+    if os.path.isfile(plain):
+        # A plain path, possibly with spaces and no quotes: run it from its folder
+        resolved = os.path.abspath(plain)
+        plan.update(exe=resolved, argv=[resolved], cwd=os.path.dirname(resolved) or None,
+                    shell=not _is_direct(resolved), stamp=file_stamp(resolved))
+        return plan
+    if URI_SCHEME.match(raw) or _needs_shell(raw):
+        # Protocol handlers, shell operators and builtins are left to the shell
+        return plan
+
+    try:
+        tokens = _split(_expand(raw))
+    except ValueError:
+        return plan  # let the shell make sense of it, as it always did
+    if not tokens:
+        plan.update(ok=False, error="Empty path")
+        return plan
+    exe, args = tokens[0], tokens[1:]
+
+    resolved = exe if os.path.isabs(exe) else shutil.which(exe)
+    if not resolved or not os.path.exists(resolved):
+        if os.path.isabs(exe) or os.sep in exe or (os.altsep and os.altsep in exe):
+            plan.update(ok=False, error=f"Not found: {exe}")
+        return plan
+
+    resolved = os.path.abspath(resolved)
+    # Arguments may be relative to the caller's folder, so only a bare
+    # executable is started from its own folder
+    plan.update(exe=resolved, argv=[resolved] + args,
+                cwd=None if args else os.path.dirname(resolved) or None,
+                shell=not _is_direct(resolved), stamp=file_stamp(resolved))
+    return plan
+
+# CreateProcess error for executables whose manifest requires elevation
+ERROR_ELEVATION_REQUIRED = 740
+
+def _shell_open(plan):
+    """Start a resolved file through the shell (shortcuts, scripts, UAC-elevated exes)."""
+    exe, args = plan["argv"][0], plan["argv"][1:]
+    if os.name == "nt":
+        # ShellExecute handles .lnk/.url/.bat and shows the UAC prompt when needed
+        os.startfile(exe, "open", subprocess.list2cmdline(args), plan["cwd"])
+        return None
+    return subprocess.Popen(shlex.join(plan["argv"]), shell=True, cwd=plan["cwd"])
+
+def launch(plan):
+    """Start a compiled plan. Raises FileNotFoundError for broken entries."""
+    if not plan["ok"]:
+        raise FileNotFoundError(plan["error"])
+    if plan["shell"]:
+        if plan["argv"] is None:
+            return subprocess.Popen(plan["raw"], shell=True, cwd=plan["cwd"])
+        # The target is known: hand it over quoted instead of re-parsing the raw string
+        return _shell_open(plan)
+    try:
+        return subprocess.Popen(plan["argv"], cwd=plan["cwd"])
+    except OSError as e:
+        if getattr(e, "winerror", None) != ERROR_ELEVATION_REQUIRED:
+            raise
+        return _shell_open(plan)
+
+class PlanCache:
+    """name -> launch plan for the catalog, recompiled only when an entry changes."""
+
+    def __init__(self):
+        self.plans = {}
+        self.lock = threading.Lock()
+        self.watcher = None
+
+    def sync(self, programs):
+        """Compile new or edited entries and drop deleted ones."""
+        with self.lock:
+            for name in [n for n in self.plans if n not in programs]:
+                del self.plans[name]
+            for name, raw in programs.items():
+                plan = self.plans.get(name)
+                if plan is None or plan["raw"] != raw.strip():
+                    self.plans[name] = compile_plan(raw)
+            return dict(self.plans)
+
+    def get(self, name, raw):
+        with self.lock:
+            plan = self.plans.get(name)
+            if plan is None or plan["raw"] != raw.strip():
+                plan = self.plans[name] = compile_plan(raw)
+            return plan
+
+    def revalidate(self):
+        """Recompile plans whose target appeared, disappeared or changed on disk."""
+        with self.lock:
+            items = list(self.plans.items())
+        changed = []
+        for name, plan in items:
+            if plan["exe"] is None and plan["ok"]:
+                continue  # shell/protocol entries have nothing to watch
+            if plan["ok"] and file_stamp(plan["exe"]) == plan["stamp"]:
+                continue
+            fresh = compile_plan(plan["raw"])
+            if fresh["ok"] == plan["ok"] and fresh["stamp"] == plan["stamp"]:
+                continue
+            with self.lock:
+                if self.plans.get(name) is plan:
+                    self.plans[name] = fresh
+                    changed.append(name)
+        return changed
+
+    def start_watcher(self, interval=REVALIDATE_INTERVAL):
+        if self.watcher:
+            return
+
+        def loop():
+            while True:
+                time.sleep(interval)
+                try:
+                    self.revalidate()
+                except Exception as e:
+                    print(f"[PlanCache] Revalidation failed: {e}")
+
+        self.watcher = threading.Thread(target=loop, daemon=True)
+        self.watcher.start()
@@ -0,0 +1,379 @@
+import json
+import os
+import random
+import socket
+import threading
+import asyncio
+import websockets
+from datetime import datetime
+import time
+import sys
+
+from JsonStore import JsonStore
+from LaunchPlan import PlanCache, launch
+
+# ============================
+# CONFIGURATION
+# ============================
+APP_NAME = "Linkium"
+
+# ✅ Use AppData path for writable files
+USER_DATA_DIR = os.path.join(os.getenv("APPDATA") or os.path.expanduser("~"), "Linkium")
+os.makedirs(USER_DATA_DIR, exist_ok=True)
+
+APP_DATA_FILE = os.path.join(USER_DATA_DIR, "apps_data.json")
+CODE_FILE = os.path.join(USER_DATA_DIR, "receiver_code.json")
+SETTINGS_FILE = os.path.join(USER_DATA_DIR, "settings.json")
+SCAN_CACHE_FILE = os.path.join(USER_DATA_DIR, "scan_cache.json")
+
+SERVER_URL = "wss://steamdeck.onrender.com/ws"
+
+# Local control port used to ask an already running receiver to open its window
+CONTROL_PORT = 47821
+
+# ============================
+# UTILITIES
+# ============================
+apps_store = JsonStore(APP_DATA_FILE, {"apps": {}})
+code_store = JsonStore(CODE_FILE, {}, delay=0)   # the pairing code is written immediately
+settings_store = JsonStore(SETTINGS_FILE, {"startup_enabled": False})
+scan_cache_store = JsonStore(SCAN_CACHE_FILE, {})
+launch_plans = PlanCache()
+
+def load_apps_data():
+    apps = apps_store.load().get("apps", {})
+    if isinstance(apps, list):
+        fixed = {a["name"]: a["path"] for a in apps if "name" in a and "path" in a}
+        save_apps_data(fixed)
+        return dict(fixed)
+    elif isinstance(apps, dict):
+        return dict(apps)
+    return {}
+
+def ensure_default_files():
+    # Ensure apps_data.json
+    if not apps_store.exists():
+        apps_store.save_now({"apps": {}})
+
+    # Ensure receiver_code.json
+    if not code_store.exists():
+        code_store.save_now({"code": str(random.randint(10**9, (10**10) - 1))})
+
+    # Ensure settings.json
+    if not settings_store.exists():
+        settings_store.save_now({"startup_enabled": False})
+
+def save_apps_data(apps):
+    apps_store.save({"apps": dict(apps)})
+    launch_plans.sync(apps)
+
+def load_or_create_code():
+    code = code_store.load().get("code")
+    if code:
+        return code
+    return regenerate_code()
+
+def regenerate_code():
+    code = str(random.randint(10**9, (10**10) - 1))
+    code_store.save_now({"code": code})
+    return code
+# ============================
+# SETTINGS (Startup Toggle)
+# ============================
+def load_settings():
+    return dict(settings_store.load())
+
+def save_settings(settings):
+    settings_store.save(settings)
+
+# ============================
+# BULK IMPORT (scan cache)
+# ============================
+def load_scan_cache():
+    return dict(scan_cache_store.load())
+
+def save_scan_cache(cache):
+    scan_cache_store.save(cache)
+
+def set_startup(enabled):
+    import winreg
+    app_name = APP_NAME
+    exe_path = os.path.abspath(sys.argv[0])
+    try:
+        with winreg.OpenKey(winreg.HKEY_CURRENT_USER,
+                            r"Software\Microsoft\Windows\CurrentVersion\Run", 0,
+                            winreg.KEY_ALL_ACCESS) as key:
+            if enabled:
+                winreg.SetValueEx(key, app_name, 0, winreg.REG_SZ, f'"{exe_path}" --silent')
+            else:
+                try:
+                    winreg.DeleteValue(key, app_name)
+                except FileNotFoundError:
+                    pass
+        return True
+    except Exception as e:
+        print(f"[ERROR] Startup registry error: {e}")
+        return False
+
+# ============================
+# RECEIVER THREAD
+# ============================
+class ReceiverThread(threading.Thread):
+    def __init__(self, app, timer=None):
+        super().__init__(daemon=True)
+        # `app` is anything with log/update_status/update_code: the window or a ConsoleSink
+        self.app = app
+        self.timer = timer
+        self.running = True
+        self.connection_status = "Disconnected"
+        self.code = load_or_create_code()
+        self.replaced_code = None   # previous code, reported once so the relay can revoke it
+        self.reconnect_event = threading.Event()
+        self.lock = threading.Lock()
+
+    async def connect_ws(self):
+        try:
+            async with websockets.connect(SERVER_URL) as ws:
+                register = {"role": "receiver", "code": self.code}
+                if self.replaced_code and self.replaced_code != self.code:
+                    register["replaces"] = self.replaced_code
+                await ws.send(json.dumps(register))
+                self.replaced_code = None
+                self.connection_status = "Connected"
+                self.app.update_status("Connected")
+                self.app.log(f"✅ Connected with code: {self.code}", "ok")
+                if self.timer and self.timer.mark_once("connected"):
+                    self.timer.report()
+                while self.running:
+                    if self.reconnect_event.is_set():
+                        self.app.log("🔄 Reconnect requested — closing current connection...", "info")
+                        break
+                    try:
+                        recv_task = asyncio.create_task(ws.recv())
+                        done, _ = await asyncio.wait({recv_task}, timeout=1.0)
+                        if recv_task in done:
+                            msg = recv_task.result()
+                            await self.handle_message(ws, json.loads(msg))
+                        else:
+                            recv_task.cancel()
+                    except websockets.exceptions.ConnectionClosed:
+                        self.app.log("⚠️ Server closed connection", "error")
+                        break
+                    except Exception as e:
+                        self.app.log(f"⚠️ Error: {e}", "error")
+                        await asyncio.sleep(0.5)
+        except Exception as e:
+            self.app.log(f"⚠️ Connection Error: {e}", "error")
+            self.connection_status = "Disconnected"
+            self.app.update_status("Disconnected")
+
+    async def handle_message(self, ws, data):
+        cmd = data.get("command")
+        latest_programs = load_apps_data()
+
+        if cmd == "get_programs":
+            plans = launch_plans.sync(latest_programs)
+            programs = []
+            for n, p in latest_programs.items():
+                entry = {"name": n, "path": p, "ok": plans[n]["ok"]}
+                if not plans[n]["ok"]:
+                    entry["error"] = plans[n]["error"]
+                programs.append(entry)
+            await ws.send(json.dumps({"programs": programs}))
+            self.app.log("📤 Sent latest program list to server", "info")
+
+        elif cmd == "open":
+            prog = data.get("program")
+            if prog in latest_programs:
+                plan = launch_plans.get(prog, latest_programs[prog])
+                try:
+                    launch(plan)
+                    self.app.log(f"🚀 Opened {prog}", "ok")
+                except Exception as e:
+                    await ws.send(json.dumps({"error": f"Failed to open {prog}: {e}", "program": prog}))
+                    self.app.log(f"❌ Failed to open {prog}: {e}", "error")
+            else:
+                self.app.log(f"❌ Unknown program: {prog}", "error")
+
+        elif cmd == "regenerate_code":
+            new_code = regenerate_code()
+            with self.lock:
+                self.replaced_code = self.replaced_code or self.code
+                self.code = new_code
+            await ws.send(json.dumps({"new_code": new_code}))
+            self.app.update_code(new_code)
+            self.app.log(f"🔁 Code regenerated remotely: {new_code}", "info")
+            self.reconnect_event.set()
+
+    def run(self):
+        launch_plans.sync(load_apps_data())
+        launch_plans.start_watcher()
+        asyncio.run(self.run_loop())
+
+    async def run_loop(self):
+        while self.running:
+            self.reconnect_event.clear()
+            await self.connect_ws()
+            if not self.running:
+                break
+            if self.reconnect_event.is_set():
+                self.app.log("🔁 Reconnecting with updated code...", "info")
+                await asyncio.sleep(0.3)
+                continue
+            self.app.log("⏳ Disconnected — retrying in 3s...", "info")
+            self.connection_status = "Disconnected"
+            self.app.update_status("Disconnected")
+            await asyncio.sleep(3)
+
+    def stop(self):
+        self.running = False
+        self.reconnect_event.set()
+
+    def trigger_reconnect(self, new_code):
+        with self.lock:
+            if new_code != self.code:
+                self.replaced_code = self.replaced_code or self.code
+            self.code = new_code
+        self.reconnect_event.set()
+
+    def attach(self, app):
+        """Route status/log callbacks to a new sink (e.g. when the window opens)."""
+        self.app = app
+        self.app.update_status(self.connection_status)
+
+# ============================
+# HEADLESS MODE
+# ============================
+class ConsoleSink:
+    """Stand-in for the window while running as a background daemon."""
+
+    def log(self, msg, level="info"):
+        timestamp = datetime.now().strftime("%H:%M:%S")
+        print(f"[{timestamp}] [{level}] {msg}", flush=True)
+
+    def update_status(self, status):
+        pass
+
+    def update_code(self, new_code):
+        pass
+
+def peak_rss_kb():
+    """Peak resident memory of this process in KiB, or None if unavailable."""
+    try:
+        import resource
+        rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return rss // 1024 if sys.platform == "darwin" else rss
+    except ImportError:
+        pass
+    try:
+        import ctypes
+        from ctypes import wintypes
+
+        class PROCESS_MEMORY_COUNTERS(ctypes.Structure):
+            _fields_ = [("cb", wintypes.DWORD), ("PageFaultCount", wintypes.DWORD)] + [
+                (n, ctypes.c_size_t) for n in (
+                    "PeakWorkingSetSize", "WorkingSetSize",
+                    "QuotaPeakPagedPoolUsage", "QuotaPagedPoolUsage",
+                    "QuotaPeakNonPagedPoolUsage", "QuotaNonPagedPoolUsage",
+                    "PagefileUsage", "PeakPagefileUsage")]
+
+        counters = PROCESS_MEMORY_COUNTERS()
+        counters.cb = ctypes.sizeof(counters)
+        kernel32 = ctypes.windll.kernel32
+        psapi = ctypes.windll.psapi
+        kernel32.GetCurrentProcess.restype = wintypes.HANDLE
+        psapi.GetProcessMemoryInfo.argtypes = [wintypes.HANDLE, ctypes.POINTER(PROCESS_MEMORY_COUNTERS), wintypes.DWORD]
+        if psapi.GetProcessMemoryInfo(kernel32.GetCurrentProcess(), ctypes.byref(counters), counters.cb):
+            return counters.PeakWorkingSetSize // 1024
+    except Exception:
+        pass
+    return None
+
+class StartupTimer:
+    """Collects named startup milestones; prints a report when enabled (--timing)."""
+
+    HEAVY_MODULES = ("customtkinter", "PIL", "pystray", "tkinter")
+
+    def __init__(self, start, enabled=False):
+        self.start = start
+        self.enabled = enabled
+        self.marks = []
+        self.lock = threading.Lock()
+
+    def mark(self, label):
+        with self.lock:
+            self.marks.append((label, time.perf_counter() - self.start))
+
+    def mark_once(self, label):
+        with self.lock:
+            if any(name == label for name, _ in self.marks):
+                return False
+            self.marks.append((label, time.perf_counter() - self.start))
+            return True
+
+    def report(self):
+        if not self.enabled:
+            return
+        with self.lock:
+            marks = list(self.marks)
+        print("[timing] startup report", flush=True)
+        for label, elapsed in marks:
+            print(f"[timing]   {label:<20} {elapsed * 1000:8.1f} ms", flush=True)
+        rss = peak_rss_kb()
+        if rss is not None:
+            print(f"[timing]   {'peak RSS':<20} {rss / 1024:8.1f} MiB", flush=True)
+        loaded = [m for m in self.HEAVY_MODULES if m in sys.modules]
+        print(f"[timing]   {'GUI modules loaded':<20} {', '.join(loaded) or 'none'}", flush=True)
+
+# ============================
+# SINGLE INSTANCE CONTROL
+# ============================
+def signal_running_instance(command=b"show"):
+    """Send a control command ("show", "quit" or "ping") to an already running
+    receiver. True if one answered."""
+    try:
+        with socket.create_connection(("127.0.0.1", CONTROL_PORT), timeout=0.5) as conn:
+            conn.sendall(command)
+        return True
+    except OSError:
+        return False
+
+class ControlListener(threading.Thread):
+    """Listens on localhost for "show"/"quit" requests from later launches."""
+
+    def __init__(self, on_show, on_quit=None):
+        super().__init__(daemon=True)
+        self.on_show = on_show
+        self.on_quit = on_quit
+        self.server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        if os.name != "nt":
+            # Allow an immediate restart after --quit (Windows has no TIME_WAIT bind issue)
+            self.server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.server.bind(("127.0.0.1", CONTROL_PORT))
+        self.server.listen(1)
+
+    def run(self):
+        while True:
+            try:
+                conn, _ = self.server.accept()
+            except OSError:
+                break
+            with conn:
+                try:
+                    command = conn.recv(16).strip()
+                    if command == b"show":
+                        self.on_show()
+                    elif command == b"quit" and self.on_quit:
+                        self.on_quit()
+                except Exception as e:
+                    print(f"[ControlListener] {e}")
+
+def start_control_listener(on_show, on_quit=None):
+    try:
+        listener = ControlListener(on_show, on_quit)
+    except OSError as e:
+        print(f"[ControlListener] Could not bind control port: {e}")
+        return None
+    listener.start()
+    return listener
+
@@ -0,0 +1,634 @@
+import customtkinter as ctk
+import threading
+from PIL import Image
+from tkinter import filedialog, messagebox
+from datetime import datetime
+import pystray
+from pystray import MenuItem as item
+
+from AppScanner import catalog_keys, default_scan_roots, scan_roots
+from ReceiverCore import (
+    APP_NAME, ReceiverThread, load_apps_data, save_apps_data, load_or_create_code,
+    regenerate_code, load_settings, save_settings, set_startup, load_scan_cache, save_scan_cache,
+    launch_plans,
+)
+from LaunchPlan import launch
+
+WINDOW_SIZE = "1100x700"
+
+# ============================
+# THEME COLORS
+# ============================
+PRIMARY_COLOR = "#00B4FF"
+PRIMARY_DARK = "#0082C1"
+GRADIENT_TOP = "#13161A"
+GRADIENT_MID = "#0F1215"
+GRADIENT_BOTTOM = "#090B0E"
+CARD_BG = "#181818"
+CARD_HOVER = "#202225"
+CARD_SELECTED = "#004E73"
+TEXT_MAIN = "#F0F0F0"
+TEXT_SUBTLE = "#A5A5A5"
+ACCENT_GREEN = "#2ECC71"
+ACCENT_RED = "#E74C3C"
+
+FONT_TITLE = ("Segoe UI", 22, "bold")
+FONT_BOLD = ("Segoe UI", 15, "bold")
+FONT_NORMAL = ("Segoe UI", 13)
+
+# Sidebar list virtualization: the row count follows the list's real height
+SIDEBAR_MAX_ROWS = 24
+SIDEBAR_ROW_HEIGHT = 34
+SIDEBAR_ROW_PITCH = SIDEBAR_ROW_HEIGHT + 6   # row height plus its vertical padding
+
+# Bulk import: discovered apps are added to the catalog in chunks of this size
+IMPORT_BATCH_SIZE = 50
+
+# ============================
+# TRAY ICON MANAGEMENT
+# ============================
+class TrayManager:
+    def __init__(self, app):
+        self.app = app
+        self.icon = None
+
+    def create_tray_icon(self):
+        # Your tray icon image (use your own icon file here)
+        image = Image.open("assets/RLogo.png")
+        menu = (
+            item('Open Linkium', self.show_app),
+            item('Exit', self.quit_app)
+        )
+        self.icon = pystray.Icon("Linkium", image, "Linkium", menu)
+        threading.Thread(target=self.icon.run, daemon=True).start()
+
+    def show_app(self):
+        # Bring window to front
+        self.app.deiconify()
+        self.app.lift()
+        self.app.focus_force()
+
+    def quit_app(self):
+        # Clean shutdown
+        if self.icon:
+            self.icon.stop()
+        self.app.on_closing()
+
+# ==========================
+# Splash Screen
+# =========================
+
+def show_splash():
+    import customtkinter as ctk
+    from PIL import Image
+    import os, sys
+
+    splash = ctk.CTk()
+    splash.geometry("400x300")
+    splash.title("")
+    splash.resizable(False, False)
+
+    # ✅ Universal base path detection
+    if getattr(sys, 'frozen', False):
+        base_path = os.path.dirname(sys.executable)
+    else:
+        base_path = os.path.dirname(os.path.abspath(__file__))
+
+    img_path = os.path.join(base_path, "assets", "RLogo.png")
+
+    try:
+        img = ctk.CTkImage(Image.open(img_path), size=(100, 100))
+        label = ctk.CTkLabel(splash, image=img, text="")
+        label.pack(pady=40)
+    except Exception as e:
+        print(f"[Splash] Failed to load image: {e}")
+
+    ctk.CTkLabel(splash, text="Linkium.space", font=("Segoe UI", 16, "bold")).pack()
+    splash.after(2500, splash.destroy)
+    splash.mainloop()
+
+# ============================
+# MAIN APPLICATION
+# ============================
+class SteamDeckApp(ctk.CTk):
+    def __init__(self, receiver_thread=None):
+        super().__init__()
+
+        # 🧠 Tray setup
+        self.tray = TrayManager(self)
+        self.tray.create_tray_icon()
+
+        # Rest of your setup
+        self.title(APP_NAME)
+        self.geometry(WINDOW_SIZE)
+        ctk.set_appearance_mode("Dark")
+        self.resizable(False, False)
+
+        # Background
+        self.bg_canvas = ctk.CTkCanvas(self, highlightthickness=0, bd=0)
+        self.bg_canvas.pack(fill="both", expand=True)
+        self._draw_gradient()
+
+        # Container
+        self.container = ctk.CTkFrame(self, fg_color="transparent")
+        self.container.place(relwidth=1, relheight=1)
+
+        # Load settings
+        self.settings = load_settings()
+
+        # State
+        self.receiver_thread = receiver_thread
+        self.programs = load_apps_data()
+        self.selected_program = None
+        self.pair_code = receiver_thread.code if receiver_thread else load_or_create_code()
+
+        # Layout
+        self.container.grid_columnconfigure(1, weight=1)
+        self.container.grid_rowconfigure(1, weight=1)
+
+        # UI
+        self.create_topbar(self.container)
+        self.create_sidebar(self.container)
+        self.create_mainpanel(self.container)
+        self.create_logger(self.container)
+
+        # Apply startup switch state
+        if self.settings.get("startup_enabled"):
+            self.startup_switch.select()
+        else:
+            self.startup_switch.deselect()
+
+        # Start receiver, or take over the one the headless daemon is running
+        if self.receiver_thread:
+            self.receiver_thread.attach(self)
+        else:
+            self.start_receiver_thread()
+
+    def _draw_gradient(self):
+        width, height = 1100, 700
+        steps = 100
+        for i in range(steps):
+            r = int(19 + (9 - 19) * i / steps)
+            g = int(22 + (11 - 22) * i / steps)
+            b = int(26 + (14 - 26) * i / steps)
+            color = f"#{r:02x}{g:02x}{b:02x}"
+            y1 = int(height * i / steps)
+            y2 = int(height * (i + 1) / steps)
+            self.bg_canvas.create_rectangle(0, y1, width, y2, outline="", fill=color)
+
+    # ======================
+    # UI
+    # ======================
+    def create_topbar(self, parent):
+        frame = ctk.CTkFrame(parent, height=65, fg_color=GRADIENT_TOP)
+        frame.grid(row=0, column=0, columnspan=2, sticky="ew")
+
+        # logo_image = ctk.CTkImage(Image.open("assets/Rlogo.png"), size=(40, 40))
+        # logo_label = ctk.CTkLabel(frame, image=logo_image, text="")
+        # logo_label.pack(side="left", padx=(20, 10))
+
+        self.code_label = ctk.CTkLabel(frame, text=f"🔑 {self.pair_code}", font=FONT_BOLD, text_color=TEXT_MAIN)
+        self.code_label.pack(side="left", padx=(30, 15))
+
+        ctk.CTkButton(frame, text="📋", width=40, height=35,
+                      fg_color="#2A2A2A", hover_color="#3A3A3A",
+                      corner_radius=12, command=self.copy_code).pack(side="left")
+
+        ctk.CTkButton(frame, text="Regenerate Code", width=160, height=35,
+                      fg_color=PRIMARY_COLOR, hover_color=PRIMARY_DARK,
+                      corner_radius=12, command=self.regenerate_code_ui).pack(side="left", padx=(20, 10))
+
+        # Startup toggle
+        self.startup_switch = ctk.CTkSwitch(frame, text="Launch on Startup",
+                                            onvalue=True, offvalue=False,
+                                            command=self.toggle_startup)
+        self.startup_switch.pack(side="right", padx=(0, 20))
+
+        # Status
+        self.status_label = ctk.CTkLabel(frame, text="🔴 Disconnected", font=FONT_NORMAL, text_color=ACCENT_RED)
+        self.status_label.pack(side="right", padx=10)
+
+    def toggle_startup(self):
+        enabled = bool(self.startup_switch.get())
+        success = set_startup(enabled)
+        if success:
+            self.settings["startup_enabled"] = enabled
+            save_settings(self.settings)
+            state = "enabled" if enabled else "disabled"
+            self.log(f"⚙️ Startup launch {state}.", "info")
+        else:
+            messagebox.showerror("Error", "Failed to modify startup setting.")
+
+    def create_sidebar(self, parent):
+        self.sidebar = ctk.CTkFrame(parent, width=260, fg_color=GRADIENT_MID)
+        self.sidebar.grid(row=1, column=0, sticky="ns")
+        ctk.CTkLabel(self.sidebar, text="📂 Installed Apps", font=FONT_BOLD, text_color=TEXT_MAIN).pack(pady=(15, 8))
+
+        # Search / filter box
+        self.search_entry = ctk.CTkEntry(self.sidebar, width=230, placeholder_text="🔍 Search apps...")
+        self.search_entry.pack(padx=10, pady=(0, 8))
+        self.search_entry.bind("<KeyRelease>", lambda e: self.apply_filter(self.search_entry.get()))
+
+        # Buttons are packed at the bottom first so the list can never push them out
+        self.import_btn = ctk.CTkButton(self.sidebar, text="📥 Import Apps", fg_color="#2A2A2A",
+                                        hover_color="#3A3A3A", command=self.import_apps_dialog)
+        self.import_btn.pack(side="bottom", fill="x", padx=20, pady=(5, 15))
+        ctk.CTkButton(self.sidebar, text="+ Add App", fg_color=PRIMARY_COLOR, hover_color=PRIMARY_DARK,
+                      command=self.add_app_dialog).pack(side="bottom", fill="x", padx=20, pady=(15, 5))
+
+        # Virtualized list: a pool of rows recycled over the filtered names.
+        # The number of rows shown is derived from the list's height in <Configure>.
+        self.app_list = ctk.CTkFrame(self.sidebar, fg_color="transparent", width=250)
+        self.app_list.pack(fill="both", expand=True, padx=10)
+        self.app_list.grid_propagate(False)
+        self.app_list.grid_columnconfigure(0, weight=1)
+        self.list_scrollbar = ctk.CTkScrollbar(self.app_list, command=self.on_sidebar_scroll)
+        self.list_scrollbar.grid(row=0, column=1, rowspan=SIDEBAR_MAX_ROWS, sticky="ns")
+
+        self.filter_text = ""
+        self.visible_names = []     # filtered names, catalog order
+        self.sidebar_offset = 0     # index of the first rendered name
+        self.visible_rows = 0       # rows that fit in the list (set by <Configure>)
+        self.row_pool = []          # [(card, label)] recycled row widgets
+        self.row_names = []         # name currently shown by each pooled row
+        self.name_widgets = {}      # name -> card, for rendered rows only
+        self.app_list.bind("<MouseWheel>", self.on_sidebar_wheel)
+        self.app_list.bind("<Configure>", self.on_list_configure)
+        self.refresh_sidebar()
+
+    def create_mainpanel(self, parent):
+        self.main_panel = ctk.CTkFrame(parent, fg_color=GRADIENT_BOTTOM, corner_radius=15)
+        self.main_panel.grid(row=1, column=1, sticky="nsew", padx=20, pady=(20, 5))
+        self.app_label = ctk.CTkLabel(self.main_panel, text="Select an Application", font=FONT_TITLE, text_color=TEXT_MAIN)
+        self.app_label.pack(pady=20)
+        self.path_label = ctk.CTkLabel(self.main_panel, text="Path: None", font=FONT_NORMAL, text_color=TEXT_SUBTLE)
+        self.path_label.pack(pady=(0, 10))
+        btn_frame = ctk.CTkFrame(self.main_panel, fg_color="transparent")
+        btn_frame.pack(pady=20)
+        self.open_btn = ctk.CTkButton(btn_frame, text="Open", state="disabled", command=self.launch_app)
+        self.edit_btn = ctk.CTkButton(btn_frame, text="Edit", state="disabled", command=self.edit_app)
+        self.del_btn = ctk.CTkButton(btn_frame, text="Delete", state="disabled",
+                                     fg_color=ACCENT_RED, hover_color="#C0392B", command=self.delete_app)
+        self.open_btn.pack(side="left", padx=10)
+        self.edit_btn.pack(side="left", padx=10)
+        self.del_btn.pack(side="left", padx=10)
+
+    def create_logger(self, parent):
+        frame = ctk.CTkFrame(parent, fg_color=GRADIENT_MID, height=150)
+        frame.grid(row=2, column=0, columnspan=2, sticky="ew", padx=15, pady=(5, 15))
+        self.log_box = ctk.CTkTextbox(frame, height=140, width=950)
+        self.log_box.pack(fill="both", padx=10, pady=10)
+        self.log_box.insert("end", "🧠 System Initialized...\n")
+        self.log_box.configure(state="disabled")
+
+    # ======================
+    # APP LOGIC
+    # ======================
+    def matches_filter(self, name):
+        return self.filter_text in name.lower()
+
+    def refresh_sidebar(self):
+        """Recompute the filtered name list and re-render the visible window."""
+        self.visible_names = [n for n in self.programs if self.matches_filter(n)]
+        self.render_rows()
+
+    def apply_filter(self, text):
+        text = text.strip().lower()
+        if text == self.filter_text:
+            return
+        self.filter_text = text
+        self.sidebar_offset = 0
+        self.refresh_sidebar()
+
+    def sidebar_upsert(self, name):
+        """Called after an app is added or edited; only touches rows that change."""
+        if name in self.name_widgets or not self.matches_filter(name):
+            return
+        if name in self.visible_names:
+            return
+        self.visible_names.append(name)
+        self.render_rows()
+
+    def sidebar_remove(self, name):
+        """Called after an app is deleted; only touches rows that change."""
+        try:
+            self.visible_names.remove(name)
+        except ValueError:
+            return
+        self.render_rows()
+
+    def add_pool_row(self):
+        i = len(self.row_pool)
+        card = ctk.CTkFrame(self.app_list, fg_color=CARD_BG, corner_radius=8, height=SIDEBAR_ROW_HEIGHT)
+        label = ctk.CTkLabel(card, text="", anchor="w", font=FONT_NORMAL)
+        label.pack(side="left", padx=10, fill="x", expand=True)
+        card.bind("<Enter>", lambda e, i=i: self.on_row_hover(i, True))
+        card.bind("<Leave>", lambda e, i=i: self.on_row_hover(i, False))
+        for w in (card, label):
+            w.bind("<Button-1>", lambda e, i=i: self.on_row_click(i))
+            w.bind("<MouseWheel>", self.on_sidebar_wheel)
+        self.row_pool.append((card, label))
+        self.row_names.append(None)
+
+    def on_list_configure(self, event):
+        rows = max(1, min(SIDEBAR_MAX_ROWS, event.height // SIDEBAR_ROW_PITCH))
+        if rows == self.visible_rows:
+            return
+        self.visible_rows = rows
+        while len(self.row_pool) < rows:
+            self.add_pool_row()
+        self.render_rows()
+
+    def render_rows(self):
+        total = len(self.visible_names)
+        max_offset = max(0, total - self.visible_rows)
+        self.sidebar_offset = min(max(0, self.sidebar_offset), max_offset)
+
+        for i, (card, label) in enumerate(self.row_pool):
+            idx = self.sidebar_offset + i
+            name = self.visible_names[idx] if idx < total and i < self.visible_rows else None
+            old = self.row_names[i]
+            if name == old:
+                continue
+            if old is not None and self.name_widgets.get(old) is card:
+                del self.name_widgets[old]
+            self.row_names[i] = name
+            if name is None:
+                card.grid_remove()
+                continue
+            self.name_widgets[name] = card
+            label.configure(text=name)
+            card.configure(fg_color=CARD_SELECTED if name == self.selected_program else CARD_BG)
+            card.grid(row=i, column=0, sticky="ew", pady=3, padx=5)
+
+        if total:
+            self.list_scrollbar.set(self.sidebar_offset / total,
+                                    min(total, self.sidebar_offset + self.visible_rows) / total)
+        else:
+            self.list_scrollbar.set(0, 1)
+
+    def scroll_sidebar_to(self, offset):
+        if offset != self.sidebar_offset:
+            self.sidebar_offset = offset
+            self.render_rows()
+
+    def on_sidebar_scroll(self, *args):
+        # Scrollbar protocol: ("moveto", fraction) or ("scroll", n, "units"|"pages")
+        if args[0] == "moveto":
+            self.scroll_sidebar_to(int(float(args[1]) * len(self.visible_names)))
+        elif args[0] == "scroll":
+            step = self.visible_rows if args[2] == "pages" else 1
+            self.scroll_sidebar_to(self.sidebar_offset + int(args[1]) * step)
+
+    def on_sidebar_wheel(self, event):
+        self.scroll_sidebar_to(self.sidebar_offset - int(event.delta / 120) * 3)
+
+    def on_row_hover(self, index, entered):
+        name = self.row_names[index]
+        if name is None or name == self.selected_program:
+            return
+        self.row_pool[index][0].configure(fg_color=CARD_HOVER if entered else CARD_BG)
+
+    def on_row_click(self, index):
+        name = self.row_names[index]
+        if name is not None:
+            self.select_app(name)
+
+    def select_app(self, name):
+        previous = self.selected_program
+        self.selected_program = name
+        self.app_label.configure(text=name)
+        plan = launch_plans.get(name, self.programs[name])
+        broken = "" if plan["ok"] else f"  ⚠️ {plan['error']}"
+        self.path_label.configure(text=f"Path: {self.programs[name]}{broken}",
+                                  text_color=TEXT_SUBTLE if plan["ok"] else ACCENT_RED)
+        self.open_btn.configure(state="normal")
+        self.edit_btn.configure(state="normal")
+        self.del_btn.configure(state="normal")
+        if previous in self.name_widgets:
+            self.name_widgets[previous].configure(fg_color=CARD_BG)
+        self.name_widgets[name].configure(fg_color=CARD_SELECTED)
+
+    # ======================
+    # FILE OPS
+    # ======================
+    def add_app_dialog(self): self.show_app_dialog("add")
+    def edit_app(self, name=None):
+        if not name and not self.selected_program: return
+        self.show_app_dialog("edit", name or self.selected_program)
+
+    def show_app_dialog(self, mode, name=None):
+        dialog = ctk.CTkToplevel(self)
+        dialog.title("Add/Edit Application")
+        dialog.geometry("400x300")
+        dialog.grab_set()
+        ctk.CTkLabel(dialog, text="Application Name:", font=FONT_NORMAL).pack(pady=(15, 5))
+        name_entry = ctk.CTkEntry(dialog, width=300)
+        name_entry.pack()
+        ctk.CTkLabel(dialog, text="Application Path:", font=FONT_NORMAL).pack(pady=(10, 5))
+        path_entry = ctk.CTkEntry(dialog, width=260)
+        path_entry.pack()
+        def browse():
+            file = filedialog.askopenfilename(filetypes=[("Executables", "*.exe"), ("All Files", "*.*")])
+            if file:
+                path_entry.delete(0, "end")
+                path_entry.insert(0, file)
+        ctk.CTkButton(dialog, text="Browse", command=browse, width=60).pack(pady=10)
+        if mode == "edit" and name:
+            name_entry.insert(0, name)
+            path_entry.insert(0, self.programs[name])
+        def save():
+            n = name_entry.get().strip()
+            p = path_entry.get().strip()
+            if not n or not p:
+                messagebox.showwarning("Error", "Both fields required", parent=dialog)
+                return
+            self.programs[n] = p
+            save_apps_data(self.programs)
+            self.sidebar_upsert(n)
+            dialog.destroy()
+            self.log(f"💾 Saved app: {n}", "ok")
+        ctk.CTkButton(dialog, text="Save", fg_color=PRIMARY_COLOR, command=save).pack(pady=10)
+
+    def import_apps_dialog(self):
+        dialog = ctk.CTkToplevel(self)
+        dialog.title("Import Applications")
+        dialog.geometry("520x360")
+        dialog.grab_set()
+        ctk.CTkLabel(dialog, text="Folders to scan (one per line):", font=FONT_NORMAL).pack(pady=(15, 5))
+        roots_box = ctk.CTkTextbox(dialog, width=480, height=200)
+        roots_box.pack(padx=15)
+        roots_box.insert("end", "\n".join(self.settings.get("scan_roots") or default_scan_roots()))
+        def add_folder():
+            folder = filedialog.askdirectory(parent=dialog)
+            if folder:
+                roots_box.insert("end", ("\n" if roots_box.get("1.0", "end").strip() else "") + folder)
+        def scan():
+            roots = [r.strip() for r in roots_box.get("1.0", "end").splitlines() if r.strip()]
+            if not roots:
+                messagebox.showwarning("Error", "Add at least one folder", parent=dialog)
+                return
+            self.settings["scan_roots"] = roots
+            save_settings(self.settings)
+            dialog.destroy()
+            self.start_import(roots)
+        btn_frame = ctk.CTkFrame(dialog, fg_color="transparent")
+        btn_frame.pack(pady=15)
+        ctk.CTkButton(btn_frame, text="Add Folder", command=add_folder, width=100).pack(side="left", padx=10)
+        ctk.CTkButton(btn_frame, text="Scan", fg_color=PRIMARY_COLOR, command=scan,
+                      width=100).pack(side="left", padx=10)
+
+    def start_import(self, roots):
+        cancel = self.import_cancel = threading.Event()
+        self.import_btn.configure(text="✖ Cancel Import", command=self.cancel_import)
+        self.log(f"🔎 Scanning {len(roots)} folder(s) for applications...", "info")
+        seen = catalog_keys(self.programs.values())
+
+        def worker():
+            cache = load_scan_cache()
+            batch = []
+
+            def flush():
+                if batch:
+                    self.after(0, self.import_apps, list(batch))
+                    batch.clear()
+
+            def found(name, path):
+                batch.append((name, path))
+                if len(batch) >= IMPORT_BATCH_SIZE:
+                    flush()
+
+            try:
+                count = scan_roots(roots, found, cache=cache, seen=seen, should_stop=cancel.is_set)
+                save_scan_cache(cache)
+            except Exception as e:
+                self.after(0, self.log, f"❌ Import failed: {e}", "error")
+                count = 0
+            flush()
+            self.after(0, self.finish_import, count, cancel.is_set())
+
+        threading.Thread(target=worker, daemon=True).start()
+
+    def import_apps(self, items):
+        """Add a chunk of discovered apps: one catalog save and one sidebar render."""
+        for name, path in items:
+            unique, i = name, 2
+            while unique in self.programs:
+                unique = f"{name} ({i})"
+                i += 1
+            self.programs[unique] = path
+            if self.matches_filter(unique):
+                self.visible_names.append(unique)
+        save_apps_data(self.programs)
+        self.render_rows()
+
+    def cancel_import(self):
+        self.import_cancel.set()
+        self.import_btn.configure(state="disabled", text="📥 Stopping...")
+
+    def finish_import(self, count, cancelled=False):
+        self.import_btn.configure(state="normal", text="📥 Import Apps", command=self.import_apps_dialog)
+        if cancelled:
+            self.log(f"📥 Import cancelled — {count} new app(s) added", "info")
+        else:
+            self.log(f"📥 Imported {count} new app(s)", "ok")
+
+    def delete_app(self):
+        name = self.selected_program
+        if not name:
+            return
+        if messagebox.askyesno("Confirm Delete", f"Delete {name}?"):
+            self.programs.pop(name, None)
+            save_apps_data(self.programs)
+            self.sidebar_remove(name)
+            self.selected_program = None
+            self.app_label.configure(text="Select an Application")
+            self.path_label.configure(text="Path: None", text_color=TEXT_SUBTLE)
+            self.open_btn.configure(state="disabled")
+            self.edit_btn.configure(state="disabled")
+            self.del_btn.configure(state="disabled")
+            self.log(f"🗑️ Deleted app: {name}", "info")
+
+    def launch_app(self):
+        name = self.selected_program
+        if not name:
+            return
+        plan = launch_plans.get(name, self.programs[name])
+        try:
+            launch(plan)
+            self.log(f"🚀 Opened {name}", "ok")
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to open {name}\n{e}")
+
+    # ======================
+    # STATUS & LOGGING
+    # ======================
+    def copy_code(self):
+        self.clipboard_clear()
+        self.clipboard_append(self.pair_code)
+        self.log("📋 Code copied to clipboard!", "info")
+
+    def update_code(self, new_code):
+        # called when code changes (UI or remote). Notify receiver thread to reconnect.
+        self.pair_code = new_code
+        self.code_label.configure(text=f"🔑 {new_code}")
+        if self.receiver_thread:
+            self.receiver_thread.trigger_reconnect(new_code)
+
+    def regenerate_code_ui(self):
+        new_code = regenerate_code()
+        self.update_code(new_code)
+        self.log(f"🔁 Code regenerated manually: {new_code}", "info")
+
+    def update_status(self, status):
+        if status == "Connected":
+            self.status_label.configure(text="🟢 Connected", text_color=ACCENT_GREEN)
+        elif status == "Disconnected":
+            self.status_label.configure(text="🔴 Disconnected", text_color=ACCENT_RED)
+
+    def log(self, msg, level="info"):
+        self.log_box.configure(state="normal")
+        timestamp = datetime.now().strftime("%H:%M:%S")
+        prefix = {"info": "💬", "ok": "✅", "error": "⚠️"}.get(level, "💬")
+        self.log_box.insert("end", f"[{timestamp}] {prefix} {msg}\n")
+        self.log_box.see("end")
+        self.log_box.configure(state="disabled")
+
+    def start_receiver_thread(self):
+        self.receiver_thread = ReceiverThread(self)
+        self.receiver_thread.start()
+
+    def request_show(self):
+        """Thread-safe: bring the window forward (used by the control listener)."""
+        self.after(0, self.tray.show_app)
+
+    def request_quit(self):
+        """Thread-safe: stop the receiver and exit (used by `Reciver.py --quit`)."""
+        self.after(0, self.shutdown)
+
+    def shutdown(self):
+        if self.tray.icon:
+            self.tray.icon.stop()
+        if self.receiver_thread:
+            self.receiver_thread.stop()
+            self.receiver_thread.join(timeout=2)
+        self.destroy()
+
+    def on_closing(self):
+        """Override window close — minimize to tray instead of exit."""
+        try:
+            # If tray exists, hide the window instead of destroying it
+            if hasattr(self, "tray") and self.tray.icon:
+                self.withdraw()
+                self.log("📥 Linkium minimized to system tray.", "info")
+                return  # Don't close app
+            else:
+                # If tray not initialized, fallback to normal close
+                if self.receiver_thread:
+                    self.log("🛑 Shutting down receiver thread...", "info")
+                    self.receiver_thread.stop()
+                    self.receiver_thread.join(timeout=2)
+                self.destroy()
+        except Exception as e:
+            print(f"[on_closing error] {e}")
+            self.destroy()
@@ -0,0 +1,107 @@
+import os
+import struct
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "Ui"))
+
+import AppScanner  # noqa: E402
+from AppScanner import scan_roots, path_key  # noqa: E402
+
+
+def touch(path, data=b""):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(data)
+
+
+def make_lnk(path, target):
+    """Minimal Shell Link file whose LinkInfo points at `target`."""
+    header = struct.pack("<I", 0x4C) + b"\0" * 16 + struct.pack("<I", 0x02)
+    header += b"\0" * (0x4C - len(header))
+    base = target.encode("cp1252") + b"\0"
+    volume_id = b"\0" * 16
+    base_off = 0x1C + len(volume_id)
+    suffix_off = base_off + len(base)
+    body = struct.pack("<6I", 0x1C, 0x01, 0x1C, base_off, 0, suffix_off) + volume_id + base + b"\0"
+    touch(path, header + struct.pack("<I", 4 + len(body)) + body)
+
+
+def scan(roots, **kwargs):
+    found = []
+    count = scan_roots(roots, lambda n, p: found.append((n, p)), **kwargs)
+    assert count == len(found)
+    return found
+
+
+def test_dedupes_by_resolved_target(tmp_path):
+    root = str(tmp_path)
+    exe = os.path.join(root, "Games", "Foo", "bin", "foo.exe")
+    touch(exe)
+    make_lnk(os.path.join(root, "StartMenu", "Foo.lnk"), exe)
+    os.symlink(exe, os.path.join(root, "alias.exe"))
+    touch(os.path.join(root, "apps", "foo.desktop"),
+          f"[Desktop Entry]\nType=Application\nName=Foo\nExec={exe} %U\n".encode())
+
+    found = scan([root])
+
+    assert len(found) == 1
+    assert AppScanner.read_lnk_target(os.path.join(root, "StartMenu", "Foo.lnk")) == exe
+
+
+def test_skips_installers_but_not_games_with_similar_words(tmp_path):
+    root = str(tmp_path)
+    for name in ("unins000.exe", "setup.exe", "vc_redist.x64.exe", "UnityCrashHandler64.exe",
+                 "CrashBandicoot.exe", "Report Card Game.exe", "Updater Tycoon.exe"):
+        touch(os.path.join(root, name))
+
+    names = sorted(n for n, _ in scan([root]))
+
+    assert "CrashBandicoot" in names
+    assert "Report Card Game" in names
+    assert "Updater Tycoon" in names
+    assert "unins000" not in names and "setup" not in names and "vc_redist.x64" not in names
+    assert "UnityCrashHandler64" not in names
+
+
+def test_depth_limit(tmp_path):
+    root = str(tmp_path)
+    touch(os.path.join(root, "a", "b", "shallow.exe"))
+    touch(os.path.join(root, "a", "b", "c", "d", "deep.exe"))
+
+    names = {n for n, _ in scan([root], max_depth=2)}
+
+    assert names == {"shallow"}
+
+
+def test_rescan_only_relists_changed_folders(tmp_path, monkeypatch):
+    root = str(tmp_path)
+    touch(os.path.join(root, "A", "a.exe"))
+    touch(os.path.join(root, "B", "b.exe"))
+    cache = {}
+    assert len(scan([root], cache=cache)) == 2
+
+    listed = []
+    real_scandir = os.scandir
+    monkeypatch.setattr(AppScanner.os, "scandir", lambda p: listed.append(p) or real_scandir(p))
+
+    seen = {path_key(os.path.join(root, d, f"{d.lower()}.exe")) for d in "AB"}
+    assert scan([root], cache=cache, seen=set(seen)) == []
+    assert listed == []
+
+    touch(os.path.join(root, "B", "new.exe"))
+    st = os.stat(os.path.join(root, "B"))
+    os.utime(os.path.join(root, "B"), ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+
+    found = scan([root], cache=cache, seen=set(seen))
+    assert [n for n, _ in found] == ["new"]
+    assert listed == [os.path.join(root, "B")]
+
+
+def test_should_stop_ends_scan_early(tmp_path):
+    root = str(tmp_path)
+    touch(os.path.join(root, "top.exe"))
+    touch(os.path.join(root, "sub", "nested.exe"))
+
+    names = {n for n, _ in scan([root], should_stop=lambda: True)}
+
+    assert "nested" not in names
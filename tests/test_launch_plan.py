@@ -0,0 +1,75 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "Ui"))
+
+import LaunchPlan  # noqa: E402
+from LaunchPlan import compile_plan, launch  # noqa: E402
+
+
+def make_exe(path):
+    with open(path, "w") as f:
+        f.write("#!/bin/sh\nexit 0\n")
+    os.chmod(path, 0o755)
+    return str(path)
+
+
+def test_uri_schemes_go_to_the_shell():
+    for raw in ("steam://rungameid/1", "ms-settings:display", "mailto:someone@example.com"):
+        plan = compile_plan(raw)
+        assert plan["ok"] and plan["shell"] and plan["argv"] is None, raw
+
+
+def test_shell_operators_and_builtins_go_to_the_shell():
+    for raw in ("cd /x && ./run", 'start "" game', "echo hi"):
+        plan = compile_plan(raw)
+        assert plan["ok"] and plan["shell"] and plan["argv"] is None, raw
+
+
+def test_explicit_missing_path_is_broken(tmp_path):
+    plan = compile_plan(os.path.join(str(tmp_path), "missing", "game.exe"))
+    assert not plan["ok"]
+    assert plan["error"].startswith("Not found")
+
+
+def test_unresolvable_bare_command_falls_back_to_shell():
+    plan = compile_plan("surely-not-a-real-command-xyz --flag")
+    assert plan["ok"] and plan["shell"] and plan["argv"] is None
+
+
+def test_env_vars_are_expanded(tmp_path, monkeypatch):
+    exe = make_exe(tmp_path / "game")
+    monkeypatch.setenv("GAMES_DIR", str(tmp_path))
+    plan = compile_plan(os.path.join("$GAMES_DIR", "game"))
+    assert plan["ok"]
+    assert plan["exe"] == exe
+
+
+def test_bare_executable_runs_from_its_folder(tmp_path):
+    exe = make_exe(tmp_path / "game")
+    plan = compile_plan(exe)
+    assert plan["argv"] == [exe]
+    assert plan["cwd"] == str(tmp_path)
+
+
+def test_executable_with_arguments_keeps_callers_cwd():
+    plan = compile_plan(f'"{sys.executable}" script.py --fast')
+    assert plan["argv"][1:] == ["script.py", "--fast"]
+    assert plan["cwd"] is None
+
+
+def test_elevation_required_retries_through_the_shell(tmp_path, monkeypatch):
+    exe = make_exe(tmp_path / "admin_tool")
+    plan = compile_plan(exe)
+    assert not plan["shell"]
+
+    def refuse(*args, **kwargs):
+        err = OSError("The requested operation requires elevation")
+        err.winerror = LaunchPlan.ERROR_ELEVATION_REQUIRED
+        raise err
+
+    opened = []
+    monkeypatch.setattr(LaunchPlan.subprocess, "Popen", refuse)
+    monkeypatch.setattr(LaunchPlan, "_shell_open", lambda p: opened.append(p["argv"]))
+    launch(plan)
+    assert opened == [[exe]]